@@ -4,19 +4,25 @@ Airflow DAG for ETL Pipeline Test.
 Tests ETL capabilities with different data sizes.
 """
 
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 
+import pandas as pd
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.models import Variable
 
-# Add shared module to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
+# Add shared module to path (guarded - the scheduler re-parses this file
+# every heartbeat)
+_SHARED_PATH = str(Path(__file__).parent.parent.parent / "shared")
+if _SHARED_PATH not in sys.path:
+    sys.path.append(_SHARED_PATH)
 
-from etl_operations import extract_data, transform_data, create_summary, load_to_database
-from database_utils import get_database_url, truncate_tables
+# Heavy shared modules (SQLAlchemy, Numba) are imported lazily inside the
+# task callables; only get_database_url is needed at parse time
+from database_utils import get_database_url
 
 
 # Configuration
@@ -29,57 +35,83 @@ DB_URL = get_database_url(
 )
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "raw"
+XCOM_DIR = Path(__file__).parent.parent.parent / "data" / "_xcom"
+
+# Pre-baked per-size constants: the scheduler re-parses this module every
+# heartbeat, so keep the DAG bodies free of path arithmetic
+INPUT_FILES = {
+    data_size: str(DATA_DIR / f"transactions_{data_size}.csv")
+    for data_size in ("small", "medium", "large")
+}
+
+
+def _write_handoff(df, **context) -> str:
+    """Write a DataFrame to a per-run Parquet file and return its path.
+
+    Only the path goes through XCom; the data itself stays on the shared
+    filesystem instead of round-tripping through the metadata DB as JSON.
+    """
+    from etl_operations import write_parquet
+
+    run_dir = XCOM_DIR / context["run_id"]
+    run_dir.mkdir(parents=True, exist_ok=True)
+    path = run_dir / f"{context['task_instance'].task_id}.parquet"
+    write_parquet(df, path)
+    return str(path)
+
+
+def _read_handoff(task_ids: str, **context):
+    """Read the Parquet handoff file written by an upstream task."""
+    path = context["task_instance"].xcom_pull(task_ids=task_ids)
+    return pd.read_parquet(path)
 
 
 def extract_task(file_path: str, file_format: str = "csv", **context):
     """Extract data from file."""
+    from etl_operations import extract_data
+
     df = extract_data(file_path, file_format)
     # Push data shape to XCom for monitoring
     context["task_instance"].xcom_push(key="extracted_rows", value=len(df))
-    return df.to_json(orient="split")  # Serialize for XCom
+    return _write_handoff(df, **context)
 
 
 def transform_task(**context):
     """Transform extracted data."""
-    import pandas as pd
-    
-    # Pull data from previous task
-    json_data = context["task_instance"].xcom_pull(task_ids="extract_data")
-    df = pd.read_json(json_data, orient="split")
-    
+    from etl_operations import transform_data
+
+    df = _read_handoff("extract_data", **context)
+
     df_transformed = transform_data(df)
     context["task_instance"].xcom_push(key="transformed_rows", value=len(df_transformed))
-    return df_transformed.to_json(orient="split")
+    return _write_handoff(df_transformed, **context)
 
 
 def create_summary_task(**context):
     """Create summary statistics."""
-    import pandas as pd
-    
-    json_data = context["task_instance"].xcom_pull(task_ids="transform_data")
-    df = pd.read_json(json_data, orient="split")
-    
+    from etl_operations import create_summary
+
+    df = _read_handoff("transform_data", **context)
+
     df_summary = create_summary(df)
-    return df_summary.to_json(orient="split")
+    return _write_handoff(df_summary, **context)
 
 
 def load_main_data_task(**context):
     """Load transformed data to database."""
-    import pandas as pd
-    
-    json_data = context["task_instance"].xcom_pull(task_ids="transform_data")
-    df = pd.read_json(json_data, orient="split")
-    
+    from etl_operations import load_to_database
+
+    df = _read_handoff("transform_data", **context)
+
     load_to_database(df, "transactions", DB_URL, if_exists="replace")
 
 
 def load_summary_data_task(**context):
     """Load summary data to database."""
-    import pandas as pd
-    
-    json_data = context["task_instance"].xcom_pull(task_ids="create_summary")
-    df = pd.read_json(json_data, orient="split")
-    
+    from etl_operations import load_to_database
+
+    df = _read_handoff("create_summary", **context)
+
     load_to_database(df, "transaction_summary", DB_URL, if_exists="replace")
 
 
@@ -109,9 +141,14 @@ default_args = {
 }
 
 
+@functools.lru_cache(maxsize=4)
 def create_etl_dag(dag_id: str, schedule: str, data_size: str):
-    """Create ETL DAG for specific data size."""
-    
+    """Create ETL DAG for specific data size.
+
+    Cached per (dag_id, schedule, data_size) so repeated parses within a
+    process reuse the already-built DAG instead of re-running the
+    Operator constructors.
+    """
     with DAG(
         dag_id=dag_id,
         default_args=default_args,
@@ -122,8 +159,8 @@ def create_etl_dag(dag_id: str, schedule: str, data_size: str):
         tags=["etl", "benchmark", data_size],
     ) as dag:
         
-        input_file = str(DATA_DIR / f"transactions_{data_size}.csv")
-        
+        input_file = INPUT_FILES[data_size]
+
         extract = PythonOperator(
             task_id="extract_data",
             python_callable=extract_task,
@@ -140,14 +177,21 @@ def create_etl_dag(dag_id: str, schedule: str, data_size: str):
             python_callable=create_summary_task,
         )
         
+        # Both loads write to the same Postgres instance; bound them with a
+        # shared pool (create with: airflow pools set postgres_write 2
+        # "DB writers"). The large tier's main load takes both slots so
+        # the 10M-row COPY never contends with the summary load.
         load_main = PythonOperator(
             task_id="load_main_data",
             python_callable=load_main_data_task,
+            pool="postgres_write",
+            pool_slots=2 if data_size == "large" else 1,
         )
-        
+
         load_summary = PythonOperator(
             task_id="load_summary_data",
             python_callable=load_summary_data_task,
+            pool="postgres_write",
         )
         
         log_metrics = PythonOperator(
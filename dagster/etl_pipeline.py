@@ -19,12 +19,22 @@ from dagster import (
     job,
     AssetIn,
     DailyPartitionsDefinition,
+    Definitions,
+    InputContext,
+    IOManager,
+    OutputContext,
 )
 
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
 
-from etl_operations import extract_data, transform_data, create_summary, load_to_database
+from etl_operations import (
+    extract_data,
+    transform_data,
+    create_summary,
+    load_to_database,
+    write_parquet,
+)
 from database_utils import get_database_url
 
 
@@ -39,6 +49,33 @@ class ETLConfig(Config):
     file_format: str = "csv"
 
 
+class ParquetIOManager(IOManager):
+    """Hand DataFrames between assets as zstd Parquet files.
+
+    The default filesystem IO manager pickles the full DataFrame between
+    assets; Parquet uses Arrow's columnar C++ writer/reader instead, so
+    the 10M-row handoff is compressed on disk and memory-mapped on load.
+    """
+
+    def __init__(self, base_dir: str | Path = "/tmp/dagster"):
+        self.base_dir = Path(base_dir)
+
+    def _path(self, context) -> Path:
+        return self.base_dir / f"{'_'.join(context.asset_key.path)}.parquet"
+
+    def handle_output(self, context: OutputContext, obj):
+        if obj is None:  # DB-load assets only have side effects
+            return
+        path = self._path(context)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_parquet(obj, path)
+
+    def load_input(self, context: InputContext) -> pd.DataFrame:
+        return pd.read_parquet(
+            self._path(context.upstream_output), engine="pyarrow", memory_map=True
+        )
+
+
 @asset(
     description="Raw transaction data extracted from source files",
     compute_kind="pandas",
@@ -214,3 +251,15 @@ etl_large_job = define_asset_job(
         }
     },
 )
+
+defs = Definitions(
+    assets=[
+        raw_transactions,
+        transformed_transactions,
+        transaction_summary,
+        transactions_db,
+        transaction_summary_db,
+    ],
+    jobs=[etl_small_job, etl_medium_job, etl_large_job],
+    resources={"io_manager": ParquetIOManager()},
+)
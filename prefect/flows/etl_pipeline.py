@@ -4,10 +4,12 @@ Prefect flow for ETL Pipeline Test.
 Tests ETL capabilities with different data sizes.
 """
 
+import asyncio
 from pathlib import Path
 from typing import Dict, Literal
 import sys
 
+import asyncpg
 import pandas as pd
 from prefect import flow, task
 from prefect.artifacts import create_table_artifact, create_markdown_artifact
@@ -15,7 +17,7 @@ from prefect.artifacts import create_table_artifact, create_markdown_artifact
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "shared"))
 
-from etl_operations import extract_data, transform_data, create_summary, load_to_database
+from etl_operations import extract_data, transform_data, create_summary
 from database_utils import get_database_url
 
 
@@ -48,16 +50,39 @@ def create_summary_task(df: pd.DataFrame) -> pd.DataFrame:
     return df_summary
 
 
+async def _copy_to_table(df: pd.DataFrame, table_name: str, database_url: str):
+    """Bulk-load a DataFrame over its own asyncpg connection with COPY.
+
+    Each caller gets a dedicated connection, so two loads against
+    different tables genuinely overlap instead of serializing on a
+    shared sync pool. Tables are created by setup_test_env beforehand.
+    """
+    conn = await asyncpg.connect(database_url)
+    try:
+        await conn.execute(f"TRUNCATE TABLE {table_name}")
+        await conn.copy_records_to_table(
+            table_name,
+            records=df.itertuples(index=False, name=None),
+            columns=list(df.columns),
+        )
+    finally:
+        await conn.close()
+
+
 @task(name="Load Main Data", retries=2)
-def load_main_data_task(df: pd.DataFrame, database_url: str):
+async def load_main_data_task(df: pd.DataFrame, database_url: str):
     """Load transformed data to database."""
-    load_to_database(df, "transactions", database_url, if_exists="replace")
+    print(f"Loading {len(df):,} rows to transactions...")
+    await _copy_to_table(df, "transactions", database_url)
+    print(f"✓ Loaded {len(df):,} rows to transactions")
 
 
 @task(name="Load Summary Data", retries=2)
-def load_summary_data_task(df: pd.DataFrame, database_url: str):
+async def load_summary_data_task(df: pd.DataFrame, database_url: str):
     """Load summary data to database."""
-    load_to_database(df, "transaction_summary", database_url, if_exists="replace")
+    print(f"Loading {len(df):,} rows to transaction_summary...")
+    await _copy_to_table(df, "transaction_summary", database_url)
+    print(f"✓ Loaded {len(df):,} rows to transaction_summary")
 
 
 @task(name="Create Metrics Artifact")
@@ -105,7 +130,7 @@ def create_metrics_artifact(
     description="Extract, Transform, and Load transaction data",
     log_prints=True,
 )
-def etl_pipeline(
+async def etl_pipeline(
     data_size: Literal["small", "medium", "large"] = "small",
     file_format: Literal["csv", "json", "parquet"] = "csv",
 ) -> Dict:
@@ -135,9 +160,12 @@ def etl_pipeline(
     # Create summary
     summary_df = create_summary_task(transformed_df)
     
-    # Load in parallel
-    load_main_data_task.submit(transformed_df, DB_URL)
-    load_summary_data_task.submit(summary_df, DB_URL)
+    # Load in parallel - two COPY streams on separate connections, no
+    # shared pool to serialize on
+    await asyncio.gather(
+        load_main_data_task(transformed_df, DB_URL),
+        load_summary_data_task(summary_df, DB_URL),
+    )
     
     # Create metrics
     create_metrics_artifact(raw_df, transformed_df, summary_df)
@@ -156,27 +184,27 @@ def etl_pipeline(
 
 # Create deployment-ready flows for different sizes
 @flow(name="ETL Pipeline - Small")
-def etl_pipeline_small():
+async def etl_pipeline_small():
     """ETL pipeline for small dataset (10K rows)."""
-    return etl_pipeline(data_size="small")
+    return await etl_pipeline(data_size="small")
 
 
 @flow(name="ETL Pipeline - Medium")
-def etl_pipeline_medium():
+async def etl_pipeline_medium():
     """ETL pipeline for medium dataset (1M rows)."""
-    return etl_pipeline(data_size="medium")
+    return await etl_pipeline(data_size="medium")
 
 
 @flow(name="ETL Pipeline - Large")
-def etl_pipeline_large():
+async def etl_pipeline_large():
     """ETL pipeline for large dataset (10M rows)."""
-    return etl_pipeline(data_size="large")
+    return await etl_pipeline(data_size="large")
 
 
 if __name__ == "__main__":
     # Run locally for testing
     import sys
-    
+
     size = sys.argv[1] if len(sys.argv) > 1 else "small"
-    result = etl_pipeline(data_size=size)
+    result = asyncio.run(etl_pipeline(data_size=size))
     print(f"\nPipeline Results: {result}")
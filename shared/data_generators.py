@@ -1,112 +1,310 @@
 """Data generators for benchmark tests."""
 
 import json
-import random
-from datetime import datetime, timedelta
+import multiprocessing as mp
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - falls back to vectorized NumPy
+    njit = prange = None
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - falls back to unfused NumPy
+    ne = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _generate_numeric(n, seed, quantity, unit_price, discount_percent, total_amount):
+        """Fill the numeric columns in one parallel LLVM-compiled pass.
+
+        The total_amount expression fuses into a single FMA loop per thread;
+        string/categorical columns stay outside (Numba cannot handle them).
+        """
+        np.random.seed(seed)
+        for i in prange(n):
+            qty = np.random.randint(1, 11)
+            price = round(np.random.uniform(5.0, 500.0), 2)
+            disc = np.random.randint(0, 5) * 5
+            quantity[i] = qty
+            unit_price[i] = price
+            discount_percent[i] = disc
+            total_amount[i] = round(qty * price * (1 - disc / 100) * 1.08, 2)
+
+else:
+    _generate_numeric = None
 
 
 def generate_sample_data(
     num_rows: int,
     output_format: Literal["csv", "json", "parquet"] = "csv",
     output_path: str | Path | None = None,
+    seed: int | None = None,
 ) -> pd.DataFrame:
     """
     Generate sample e-commerce transaction data.
-    
+
     Args:
         num_rows: Number of rows to generate
         output_format: Output format (csv, json, parquet)
         output_path: Path to save the file. If None, returns DataFrame only
-        
+        seed: RNG seed for reproducible output. If None, entropy-seeded
+
     Returns:
         DataFrame with generated data
     """
-    # Generate realistic transaction data
+    # Generate realistic transaction data with batched NumPy RNG calls
+    # (one C-level draw per column instead of one Python call per row)
     categories = ["Electronics", "Clothing", "Books", "Home & Garden", "Sports", "Toys"]
     statuses = ["completed", "pending", "cancelled", "refunded"]
     payment_methods = ["credit_card", "debit_card", "paypal", "crypto"]
-    
+    countries = ["USA", "Canada", "UK", "Germany", "France", "Australia"]
+
     start_date = datetime(2023, 1, 1)
-    
+    rng = np.random.default_rng(seed)
+
+    num_customers = max(num_rows // 10, 1)
+    customer_nums = rng.integers(1, num_customers + 1, size=num_rows)
+    # Unicode widths sized to the largest possible value: a fixed width
+    # silently truncates once the IDs outgrow it (e.g. 7-digit customer
+    # numbers on the 10M-row tier)
+    customer_width = len(str(num_customers))
+    txn_width = len(str(max(num_rows - 1, 0)))
+    customer_digits = np.char.zfill(customer_nums.astype(f"U{customer_width}"), 6)
+
+    # Numeric columns: JIT-compiled parallel kernel when Numba is available,
+    # otherwise plain vectorized NumPy. Narrow dtypes halve frame memory
+    # and DB load bandwidth; 2-decimal currency under 10000 fits float32.
+    if _generate_numeric is not None:
+        quantity = np.empty(num_rows, dtype=np.int8)
+        unit_price = np.empty(num_rows, dtype=np.float32)
+        discount_percent = np.empty(num_rows, dtype=np.int8)
+        total_amount = np.empty(num_rows, dtype=np.float32)
+        _generate_numeric(
+            num_rows,
+            int(rng.integers(0, 2**31 - 1)),
+            quantity,
+            unit_price,
+            discount_percent,
+            total_amount,
+        )
+    else:
+        quantity = rng.integers(1, 11, size=num_rows, dtype=np.int8)
+        unit_price = rng.uniform(5.0, 500.0, size=num_rows).round(2).astype(np.float32)
+        discount_percent = rng.choice(
+            np.array([0, 5, 10, 15, 20], dtype=np.int8), size=num_rows
+        )
+        if ne is not None:
+            # Single fused multithreaded loop, no intermediate arrays
+            total_amount = ne.evaluate(
+                "q * p * (1 - d * 0.01) * 1.08",
+                local_dict={"q": quantity, "p": unit_price, "d": discount_percent},
+            ).round(2).astype(np.float32)
+        else:
+            total_amount = (
+                (quantity * unit_price * (1 - discount_percent / 100) * 1.08)
+                .round(2)
+                .astype(np.float32)
+            )
+
+    # High-cardinality string columns use Arrow-backed storage (contiguous
+    # buffers instead of one PyObject per row); low-cardinality columns use
+    # dictionary-encoded categoricals. Cuts DataFrame memory 5-10x at 10M rows.
+    arrow_string = pd.ArrowDtype(pa.string())
+
+    def _categorical(values, size):
+        codes = rng.integers(0, len(values), size=size)
+        return pd.Categorical.from_codes(codes, categories=values)
+
     data = {
-        "transaction_id": [f"TXN{i:08d}" for i in range(num_rows)],
-        "customer_id": [f"CUST{random.randint(1, num_rows // 10):06d}" for _ in range(num_rows)],
-        "product_name": [f"Product_{random.randint(1, 1000)}" for _ in range(num_rows)],
-        "category": [random.choice(categories) for _ in range(num_rows)],
-        "quantity": [random.randint(1, 10) for _ in range(num_rows)],
-        "unit_price": [round(random.uniform(5.0, 500.0), 2) for _ in range(num_rows)],
-        "total_amount": [0.0] * num_rows,  # Will calculate below
-        "discount_percent": [random.choice([0, 5, 10, 15, 20]) for _ in range(num_rows)],
-        "tax_rate": [0.08] * num_rows,  # 8% tax
-        "payment_method": [random.choice(payment_methods) for _ in range(num_rows)],
-        "status": [random.choice(statuses) for _ in range(num_rows)],
-        "transaction_date": [
-            (start_date + timedelta(days=random.randint(0, 700))).strftime("%Y-%m-%d %H:%M:%S")
-            for _ in range(num_rows)
-        ],
-        "shipping_country": [
-            random.choice(["USA", "Canada", "UK", "Germany", "France", "Australia"])
-            for _ in range(num_rows)
-        ],
-        "customer_email": [
-            f"customer{random.randint(1, num_rows // 10)}@example.com"
-            for _ in range(num_rows)
-        ],
+        "transaction_id": pd.array(
+            np.char.add("TXN", np.char.zfill(np.arange(num_rows).astype(f"U{txn_width}"), 8)),
+            dtype=arrow_string,
+        ),
+        "customer_id": pd.array(
+            np.char.add("CUST", customer_digits), dtype=arrow_string
+        ),
+        "product_name": pd.array(
+            np.char.add("Product_", rng.integers(1, 1001, size=num_rows).astype("U4")),
+            dtype=arrow_string,
+        ),
+        "category": _categorical(categories, num_rows),
+        "quantity": quantity,
+        "unit_price": unit_price,
+        "total_amount": total_amount,
+        "discount_percent": discount_percent,
+        "tax_rate": np.full(num_rows, 0.08, dtype=np.float32),  # 8% tax
+        "payment_method": _categorical(payment_methods, num_rows),
+        "status": _categorical(statuses, num_rows),
+        "transaction_date": start_date
+        + pd.to_timedelta(rng.integers(0, 700 * 86400, size=num_rows), unit="s"),
+        "shipping_country": _categorical(countries, num_rows),
+        "customer_email": pd.array(
+            np.char.add(
+                np.char.add("customer", customer_nums.astype(f"U{customer_width}")),
+                "@example.com",
+            ),
+            dtype=arrow_string,
+        ),
     }
-    
+
     df = pd.DataFrame(data)
-    
-    # Calculate total_amount
-    df["total_amount"] = (
-        df["quantity"] * df["unit_price"] * (1 - df["discount_percent"] / 100) * (1 + df["tax_rate"])
-    ).round(2)
-    
+
     # Save to file if path provided
     if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        if output_format == "csv":
-            df.to_csv(output_path, index=False)
-        elif output_format == "json":
-            df.to_json(output_path, orient="records", lines=True)
-        elif output_format == "parquet":
-            df.to_parquet(output_path, index=False)
-            
+        write_dataset(df, output_path, output_format)
         print(f"Generated {num_rows} rows and saved to {output_path}")
-    
+
     return df
 
 
-def create_test_datasets(base_path: str | Path = "data/raw"):
-    """Create all test datasets (small, medium, large)."""
+# MB-sized block buffering amortizes write syscalls across the 10M-row files
+_WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def _advise_sequential(fh):
+    """Hint the kernel that the file will be accessed sequentially."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _write_csv_overlapped(table: pa.Table, output_path: Path):
+    """Write a CSV in 1M-row batches while a writer thread drains to disk.
+
+    Serializing the next RecordBatch overlaps with the blocking write of
+    the previous one (a portable stand-in for io_uring-style batched
+    writes), so the large tier stays bandwidth-bound instead of
+    alternating between formatting and waiting on write syscalls.
+    """
+    buffers: queue.Queue = queue.Queue(maxsize=4)
+    write_errors: list[Exception] = []
+
+    with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as fh:
+        _advise_sequential(fh)
+
+        def _drain():
+            # Keep consuming after a failure so the producer never blocks
+            # on a full queue; the error surfaces after join()
+            while (buffer := buffers.get()) is not None:
+                if write_errors:
+                    continue
+                try:
+                    fh.write(buffer)
+                except Exception as exc:  # noqa: BLE001 - re-raised below
+                    write_errors.append(exc)
+
+        writer = threading.Thread(target=_drain)
+        writer.start()
+        try:
+            for i, batch in enumerate(table.to_batches(max_chunksize=1_000_000)):
+                sink = pa.BufferOutputStream()
+                pacsv.write_csv(
+                    batch,
+                    sink,
+                    write_options=pacsv.WriteOptions(
+                        batch_size=65536, include_header=(i == 0)
+                    ),
+                )
+                buffers.put(sink.getvalue())
+        finally:
+            buffers.put(None)
+            writer.join()
+    if write_errors:
+        raise write_errors[0]
+
+
+def write_dataset(
+    df: pd.DataFrame,
+    output_path: str | Path,
+    output_format: Literal["csv", "json", "parquet"] = "csv",
+):
+    """Serialize a generated DataFrame to disk in the given format."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if output_format == "csv":
+        # Arrow's multi-threaded C++ writer is several times faster than
+        # pandas' Python-level CSV formatting
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        _write_csv_overlapped(table, output_path)
+    elif output_format == "json":
+        with open(output_path, "w", buffering=_WRITE_BUFFER_SIZE) as fh:
+            _advise_sequential(fh)
+            # date_format=iso keeps transaction_date parseable by the
+            # ISO8601 fast path in transform_data (the default serializes
+            # datetimes as epoch milliseconds)
+            df.to_json(fh, orient="records", lines=True, date_format="iso")
+    elif output_format == "parquet":
+        # Arrow serializes its own buffers directly (dictionary-encoded
+        # categoricals included), so skip the pandas writer. Large row
+        # groups keep metadata overhead low for 10M-row scans.
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(
+            table, output_path, compression="zstd", row_group_size=1_000_000
+        )
+
+
+def _generate_size_tier(size_name: str, num_rows: int, base_path: str, seed: int):
+    """Worker: generate one size tier and write it in all three formats."""
     base_path = Path(base_path)
-    
+    print(f"Generating {size_name} dataset ({num_rows:,} rows)...")
+
+    # Generate once, serialize three times - the RNG phase dominates
+    df = generate_sample_data(num_rows, seed=seed)
+
+    # The writers release the GIL during their C-level I/O and target
+    # independent files, so the three formats finish in max() rather
+    # than sum() time
+    paths = {
+        output_format: base_path / f"transactions_{size_name}.{output_format}"
+        for output_format in ("csv", "json", "parquet")
+    }
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = {
+            output_format: pool.submit(write_dataset, df, path, output_format)
+            for output_format, path in paths.items()
+        }
+        for output_format, future in futures.items():
+            future.result()
+            print(f"  - Saved {paths[output_format]}")
+
+
+def create_test_datasets(base_path: str | Path = "data/raw", base_seed: int = 42):
+    """Create all test datasets (small, medium, large).
+
+    The three size tiers are independent, so each is generated in its own
+    worker process; per-tier seeds keep the output reproducible.
+    """
     datasets = {
         "small": 10_000,
         "medium": 1_000_000,
         "large": 10_000_000,
     }
-    
-    for size_name, num_rows in datasets.items():
-        print(f"\nGenerating {size_name} dataset ({num_rows:,} rows)...")
-        
-        # CSV format
-        csv_path = base_path / f"transactions_{size_name}.csv"
-        generate_sample_data(num_rows, "csv", csv_path)
-        
-        # JSON format
-        json_path = base_path / f"transactions_{size_name}.json"
-        generate_sample_data(num_rows, "json", json_path)
-        
-        # Parquet format
-        parquet_path = base_path / f"transactions_{size_name}.parquet"
-        generate_sample_data(num_rows, "parquet", parquet_path)
-    
+
+    with mp.Pool(processes=len(datasets)) as pool:
+        pool.starmap(
+            _generate_size_tier,
+            [
+                (size_name, num_rows, str(base_path), base_seed + shard_id)
+                for shard_id, (size_name, num_rows) in enumerate(datasets.items())
+            ],
+        )
+
     print("\n✓ All datasets generated successfully!")
 
 
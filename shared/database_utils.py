@@ -1,8 +1,12 @@
 """Database utilities for ETL tests."""
 
+import functools
+
 from sqlalchemy import (
+    Boolean,
     Column,
     Integer,
+    SmallInteger,
     String,
     Float,
     DateTime,
@@ -26,15 +30,25 @@ class Transaction(Base):
     product_name = Column(String(200), nullable=False)
     category = Column(String(100), nullable=False)
     quantity = Column(Integer, nullable=False)
-    unit_price = Column(Float, nullable=False)
-    total_amount = Column(Float, nullable=False)
-    discount_percent = Column(Float, nullable=False)
-    tax_rate = Column(Float, nullable=False)
+    # precision=24 maps to PostgreSQL real (4 bytes) - matches the
+    # float32 columns produced by the data generator
+    unit_price = Column(Float(precision=24), nullable=False)
+    total_amount = Column(Float(precision=24), nullable=False)
+    discount_percent = Column(Float(precision=24), nullable=False)
+    tax_rate = Column(Float(precision=24), nullable=False)
     payment_method = Column(String(50), nullable=False)
     status = Column(String(50), nullable=False)
     transaction_date = Column(DateTime, nullable=False)
     shipping_country = Column(String(100), nullable=False)
     customer_email = Column(String(200), nullable=False)
+    # Derived columns added by transform_data; the load paths truncate and
+    # append into this table, so it must carry the transformed schema
+    year = Column(SmallInteger, nullable=False)
+    month = Column(SmallInteger, nullable=False)
+    day_of_week = Column(String(10), nullable=False)
+    is_weekend = Column(Boolean, nullable=False)
+    customer_segment = Column(String(20), nullable=False)
+    estimated_profit = Column(Float(precision=24), nullable=False)
 
 
 class TransactionSummary(Base):
@@ -75,9 +89,28 @@ def drop_tables(database_url: str):
     print("✓ Database tables dropped successfully!")
 
 
+@functools.lru_cache(maxsize=4)
 def get_engine(database_url: str):
-    """Get SQLAlchemy engine."""
-    return create_engine(database_url, pool_pre_ping=True)
+    """Get a SQLAlchemy engine, cached per URL.
+
+    Creating an engine spawns a fresh connection pool (plus DNS lookup),
+    so reuse one per URL across tasks in the same worker process. For
+    psycopg2, executemany_mode collapses batched INSERTs into multi-VALUES
+    statements.
+    """
+    kwargs = {
+        "pool_pre_ping": True,
+        "pool_size": 4,
+        "max_overflow": 0,
+        "pool_recycle": 300,
+    }
+    if database_url.startswith("postgresql"):
+        kwargs.update(
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=10000,
+            executemany_batch_page_size=1000,
+        )
+    return create_engine(database_url, **kwargs)
 
 
 def get_session(database_url: str):
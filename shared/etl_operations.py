@@ -1,23 +1,116 @@
 """Shared ETL operations for all orchestrators."""
 
+import io
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
+from sqlalchemy import text
+
+from database_utils import get_engine
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - falls back to pandas
+    njit = prange = None
+
+try:
+    from adbc_driver_postgresql import dbapi as adbc_pg
+except ImportError:  # pragma: no cover - falls back to CSV COPY
+    adbc_pg = None
+
+logger = logging.getLogger(__name__)
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _transform_core(total_amount, quantity, keep, profit, segment_codes):
+        """Validation mask plus derived numerics in one parallel pass.
+
+        cache=True persists the compiled artifact so only the first run
+        pays the JIT cost.
+        """
+        for i in prange(total_amount.shape[0]):
+            total = total_amount[i]
+            keep[i] = (total > 0) and (quantity[i] > 0)
+            profit[i] = round(total * 0.3, 2)
+            if total <= 50:
+                segment_codes[i] = 0
+            elif total <= 200:
+                segment_codes[i] = 1
+            else:
+                segment_codes[i] = 2
+
+else:
+    _transform_core = None
+
+CUSTOMER_SEGMENTS = ["low_value", "medium_value", "high_value"]
+
+# Weekday names indexed by pandas dayofweek codes (Monday=0)
+WEEKDAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+# Low-cardinality columns: dictionary-encoded codes instead of one Python
+# string object per row (also makes groupby hash int codes, not strings)
+CATEGORICAL_COLUMNS = ["category", "status", "payment_method", "shipping_country"]
+
+# Explicit schema for the transaction CSVs: skips pandas' per-column dtype
+# inference and parses transaction_date during the CSV scan
+CSV_COLUMN_TYPES = {
+    "transaction_id": pa.string(),
+    "customer_id": pa.string(),
+    "product_name": pa.string(),
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "quantity": pa.int8(),
+    "unit_price": pa.float32(),
+    "total_amount": pa.float32(),
+    "discount_percent": pa.int8(),
+    "tax_rate": pa.float32(),
+    "payment_method": pa.dictionary(pa.int32(), pa.string()),
+    "status": pa.dictionary(pa.int32(), pa.string()),
+    # ns matches the precision Arrow's CSV writer emits for the generated
+    # datasets; a coarser unit makes read_csv fail on the fractional part
+    "transaction_date": pa.timestamp("ns"),
+    "shipping_country": pa.dictionary(pa.int32(), pa.string()),
+    "customer_email": pa.string(),
+}
 
 
 def extract_data(
     file_path: str | Path,
     file_format: Literal["csv", "json", "parquet"] = "csv",
+    columns: list[str] | None = None,
+    filters: "pads.Expression | None" = None,
 ) -> pd.DataFrame:
     """
     Extract data from file.
-    
+
     Args:
         file_path: Path to data file
         file_format: Format of the file (csv, json, parquet)
-        
+        columns: Optional projection; for parquet, unused columns are
+            never materialized
+        filters: Optional pyarrow.dataset filter expression, pushed down
+            to the parquet reader so row groups can be skipped on their
+            statistics
+
     Returns:
         DataFrame with extracted data
     """
@@ -26,73 +119,147 @@ def extract_data(
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    print(f"Extracting data from {file_path}...")
+    logger.info("Extracting data from %s...", file_path)
     
     if file_format == "csv":
-        df = pd.read_csv(file_path)
+        # Arrow's multi-threaded block parser with an explicit schema -
+        # no dtype guessing and no object-dtype materialization
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+            convert_options=pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES),
+        )
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
     elif file_format == "json":
-        df = pd.read_json(file_path, lines=True)
+        df = pd.read_json(file_path, lines=True, dtype_backend="pyarrow")
     elif file_format == "parquet":
-        df = pd.read_parquet(file_path)
+        # Predicate and projection pushdown: row groups whose statistics
+        # fail the filter are skipped, unused columns never materialize
+        table = pads.dataset(file_path, format="parquet").to_table(
+            columns=columns, filter=filters
+        )
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
     else:
         raise ValueError(f"Unsupported format: {file_format}")
-    
-    print(f"✓ Extracted {len(df):,} rows")
+
+    if columns is not None and file_format != "parquet":
+        df = df[columns]
+
+    # Dictionary-encode low-cardinality columns (4-6 unique values each)
+    categorical = {
+        column: "category"
+        for column in CATEGORICAL_COLUMNS
+        if column in df.columns and df[column].dtype != "category"
+    }
+    if categorical:
+        df = df.astype(categorical)
+
+    logger.info("Extracted %s rows", f"{len(df):,}")
     return df
 
 
 def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Transform data: clean, validate, enrich.
-    
+
+    The input frame is not copied (copying doubled peak memory on the
+    10M-row tier); derived columns may be added to it in place, so
+    callers must not rely on the input staying unmodified.
+
     Args:
         df: Input DataFrame
-        
+
     Returns:
         Transformed DataFrame
     """
-    print(f"Transforming {len(df):,} rows...")
-    
-    # Create a copy to avoid modifying original
-    df = df.copy()
-    
+    logger.info("Transforming %s rows...", f"{len(df):,}")
+
     # Data cleaning
-    # Remove duplicates
+    # Remove duplicates - the single-key duplicated() mask hits the hash
+    # table directly instead of drop_duplicates' generic multi-column path
     original_count = len(df)
-    df = df.drop_duplicates(subset=["transaction_id"])
+    df = df.loc[~df["transaction_id"].duplicated(keep="first")]
     duplicates_removed = original_count - len(df)
     if duplicates_removed > 0:
-        print(f"  - Removed {duplicates_removed} duplicate rows")
-    
-    # Handle missing values
-    df = df.dropna(subset=["transaction_id", "customer_id", "total_amount"])
-    
-    # Data validation
-    # Remove invalid transactions (negative amounts)
-    df = df[df["total_amount"] > 0]
-    df = df[df["quantity"] > 0]
-    
-    # Convert date strings to datetime
-    df["transaction_date"] = pd.to_datetime(df["transaction_date"])
-    
+        logger.info("Removed %d duplicate rows", duplicates_removed)
+    
+    # Missing values, invalid amounts/quantities: one fused mask, one pass
+    # over each column, one output frame instead of three
+    if _transform_core is not None:
+        # Single JIT-compiled pass over contiguous buffers: validity mask
+        # (NaN amounts/quantities compare false, covering the NA check),
+        # profit margin, and customer segment codes
+        total_amount = np.ascontiguousarray(df["total_amount"].to_numpy(dtype=np.float64))
+        quantity = np.ascontiguousarray(df["quantity"].to_numpy(dtype=np.float64))
+        keep = np.empty(len(df), dtype=np.bool_)
+        profit = np.empty(len(df), dtype=np.float64)
+        segment_codes = np.empty(len(df), dtype=np.int8)
+        _transform_core(total_amount, quantity, keep, profit, segment_codes)
+        keep &= df["transaction_id"].notna().to_numpy()
+        keep &= df["customer_id"].notna().to_numpy()
+
+        df["customer_segment"] = pd.Categorical.from_codes(
+            segment_codes, categories=CUSTOMER_SEGMENTS
+        )
+        df["estimated_profit"] = profit
+        df = df.loc[keep]
+    else:
+        keep = (
+            df["transaction_id"].notna().to_numpy()
+            & df["customer_id"].notna().to_numpy()
+            & (df["total_amount"] > 0).to_numpy()
+            & (df["quantity"] > 0).to_numpy()
+        )
+
+        # Categorize customers by purchase amount: branchless bin codes in
+        # one searchsorted pass instead of pd.cut's label machinery
+        # (side="left" keeps pd.cut's right-closed edges: 50 -> low_value)
+        segment_codes = np.searchsorted(
+            np.array([50.0, 200.0]),
+            df["total_amount"].to_numpy(dtype=np.float64),
+            side="left",
+        ).astype(np.int8)
+        df["customer_segment"] = pd.Categorical.from_codes(
+            segment_codes, categories=CUSTOMER_SEGMENTS
+        )
+
+        # Calculate profit margin (simplified) - single buffer, rounded
+        # in place, no intermediate Series
+        profit = np.multiply(df["total_amount"].to_numpy(dtype=np.float64), 0.3)
+        np.round(profit, 2, out=profit)
+        df["estimated_profit"] = profit
+        df = df.loc[keep]
+
+    # Convert date strings to datetime - a no-op when the source already
+    # delivered typed timestamps (parquet, or CSV read with the schema).
+    # kind covers ArrowDtype timestamps, which is_datetime64_any_dtype
+    # does not recognize
+    if df["transaction_date"].dtype.kind != "M":
+        df["transaction_date"] = pd.to_datetime(
+            df["transaction_date"], format="ISO8601", cache=True
+        )
+
     # Data enrichment
-    # Add derived columns
-    df["year"] = df["transaction_date"].dt.year
-    df["month"] = df["transaction_date"].dt.month
-    df["day_of_week"] = df["transaction_date"].dt.day_name()
-    df["is_weekend"] = df["transaction_date"].dt.dayofweek >= 5
-    
-    # Categorize customers by purchase amount
-    df["customer_segment"] = pd.cut(
-        df["total_amount"],
-        bins=[0, 50, 200, float("inf")],
-        labels=["low_value", "medium_value", "high_value"],
-    )
-    
-    # Calculate profit margin (simplified)
-    df["estimated_profit"] = (df["total_amount"] * 0.3).round(2)
-    
-    print(f"✓ Transformed data: {len(df):,} rows")
+    # Derive all date parts from one DatetimeIndex: one pass over the
+    # datetime64 buffer instead of four accessor round-trips, and the
+    # weekday codes are shared between day_of_week and is_weekend
+    dt_index = pd.DatetimeIndex(df["transaction_date"])
+    day_of_week = dt_index.dayofweek.to_numpy()
+    # Narrow dtypes: every later pass over these columns moves half (or a
+    # quarter) of the bytes an int64 column would
+    df["year"] = dt_index.year.astype(np.int16)
+    df["month"] = dt_index.month.astype(np.int8)
+    df["day_of_week"] = pd.Categorical.from_codes(day_of_week, categories=WEEKDAY_NAMES)
+    df["is_weekend"] = day_of_week >= 5
+
+    # Re-materialize the aggregation columns as C-contiguous buffers: the
+    # column inserts and row mask above can leave the block manager with
+    # fragmented/strided blocks, which severely degrades the groupby in
+    # create_summary (pandas#26502)
+    df["total_amount"] = np.ascontiguousarray(df["total_amount"].to_numpy())
+    df["quantity"] = np.ascontiguousarray(df["quantity"].to_numpy())
+
+    logger.info("Transformed data: %s rows", f"{len(df):,}")
     return df
 
 
@@ -106,23 +273,26 @@ def create_summary(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Summary DataFrame
     """
-    print("Creating summary statistics...")
+    logger.info("Creating summary statistics...")
     
     summary = (
-        df.groupby("category")
+        df.groupby("category", observed=True, sort=False)
         .agg(
             total_transactions=("transaction_id", "count"),
             total_revenue=("total_amount", "sum"),
-            avg_order_value=("total_amount", "mean"),
             total_quantity=("quantity", "sum"),
         )
         .reset_index()
     )
-    
+
+    # Derive the mean from the sum and count already in hand instead of a
+    # second full aggregation pass over total_amount
+    summary["avg_order_value"] = (
+        summary["total_revenue"] / summary["total_transactions"]
+    ).round(2)
     summary["total_revenue"] = summary["total_revenue"].round(2)
-    summary["avg_order_value"] = summary["avg_order_value"].round(2)
     
-    print(f"✓ Created summary with {len(summary)} categories")
+    logger.info("Created summary with %d categories", len(summary))
     return summary
 
 
@@ -143,21 +313,117 @@ def load_to_database(
         if_exists: How to behave if table exists
         batch_size: Number of rows per batch
     """
-    print(f"Loading {len(df):,} rows to {table_name}...")
-    
-    engine = create_engine(database_url)
-    
-    # Load in batches for better performance
-    df.to_sql(
-        table_name,
-        engine,
-        if_exists=if_exists,
-        index=False,
-        chunksize=batch_size,
-        method="multi",
-    )
-    
-    print(f"✓ Loaded {len(df):,} rows to {table_name}")
+    num_rows = len(df)
+    logger.info("Loading %s rows to %s...", f"{num_rows:,}", table_name)
+
+    engine = get_engine(database_url)
+
+    if adbc_pg is not None and engine.dialect.name == "postgresql":
+        _adbc_ingest(df, table_name, database_url, if_exists)
+    elif engine.dialect.name == "postgresql":
+        _copy_to_postgres(df, table_name, engine, if_exists)
+    else:
+        # Fallback for non-PostgreSQL databases. Batch sizing is
+        # dialect-sensitive: MySQL/MariaDB/DuckDB keep scaling up to
+        # ~50K rows per INSERT batch, while most others saturate around
+        # 1K and then regress on oversized statements.
+        if engine.dialect.name in ("mysql", "mariadb", "duckdb"):
+            chunksize = min(batch_size, 50_000)
+        else:
+            chunksize = min(batch_size, 1_000)
+        df.to_sql(
+            table_name,
+            engine,
+            if_exists=if_exists,
+            index=False,
+            chunksize=chunksize,
+            method="multi",
+        )
+
+    logger.info("Loaded %s rows to %s", f"{num_rows:,}", table_name)
+
+
+def _adbc_ingest(
+    df: pd.DataFrame,
+    table_name: str,
+    database_url: str,
+    if_exists: Literal["fail", "replace", "append"],
+):
+    """Stream Arrow buffers into Postgres via ADBC binary COPY.
+
+    The Arrow C Data Interface hands the column buffers to the driver
+    directly - no per-cell Python objects, no CSV rendering. Tables are
+    expected to exist (setup_test_env creates them); "replace" truncates
+    rather than dropping so the declared schema survives.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with adbc_pg.connect(database_url) as conn:
+        with conn.cursor() as cursor:
+            if if_exists == "replace":
+                cursor.execute(f"TRUNCATE TABLE {table_name}")
+            cursor.adbc_ingest(table_name, table, mode="append")
+        conn.commit()
+
+
+class _CsvStream(io.RawIOBase):
+    """Lazily render a DataFrame as CSV bytes for copy_expert.
+
+    copy_expert pulls from this in blocks, so only ~chunk_rows worth of
+    CSV text is ever materialized instead of the whole multi-GB payload.
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = 100_000):
+        self._chunks = (
+            df.iloc[i : i + chunk_rows].to_csv(index=False, header=False).encode()
+            for i in range(0, len(df), chunk_rows)
+        )
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            out, self._buffer = self._buffer, b""
+        else:
+            out, self._buffer = self._buffer[:size], self._buffer[size:]
+        return out
+
+
+def _copy_to_postgres(
+    df: pd.DataFrame,
+    table_name: str,
+    engine,
+    if_exists: Literal["fail", "replace", "append"],
+):
+    """Bulk-load a DataFrame with COPY FROM STDIN.
+
+    COPY is parsed server-side with no per-row SQL, so it runs an order of
+    magnitude faster than batched INSERTs. For "replace" the table is
+    truncated rather than dropped, skipping the DDL roundtrip.
+    """
+    with engine.begin() as conn:
+        # Create the table if it does not exist yet; no-op otherwise
+        df.head(0).to_sql(table_name, conn, index=False, if_exists="append")
+        if if_exists == "replace":
+            conn.execute(text(f"TRUNCATE TABLE {table_name}"))
+
+    columns = ", ".join(df.columns)
+    raw_conn = engine.raw_connection()
+    try:
+        with raw_conn.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table_name} ({columns}) FROM STDIN WITH CSV",
+                _CsvStream(df),
+            )
+        raw_conn.commit()
+    finally:
+        raw_conn.close()
 
 
 def run_etl_pipeline(
@@ -173,9 +439,7 @@ def run_etl_pipeline(
         database_url: Database connection URL
         file_format: Input file format
     """
-    print("\n" + "=" * 60)
-    print("Starting ETL Pipeline")
-    print("=" * 60)
+    logger.info("Starting ETL Pipeline")
     
     # Extract
     df = extract_data(input_file, file_format)
@@ -183,16 +447,29 @@ def run_etl_pipeline(
     # Transform
     df_transformed = transform_data(df)
     
-    # Load main data
-    load_to_database(df_transformed, "transactions", database_url, if_exists="replace")
-    
-    # Create and load summary
-    df_summary = create_summary(df_transformed)
-    load_to_database(df_summary, "transaction_summary", database_url, if_exists="replace")
-    
-    print("\n" + "=" * 60)
-    print("✓ ETL Pipeline completed successfully!")
-    print("=" * 60 + "\n")
+    # Create summary - only the aggregation columns, so the groupby scans
+    # a four-column frame instead of the full 20 columns
+    df_summary = create_summary(
+        df_transformed[["category", "transaction_id", "total_amount", "quantity"]]
+    )
+
+    # Load main data and summary concurrently - they hit different tables
+    # over separate pooled connections, so wall time is max() not sum()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [
+            pool.submit(
+                load_to_database, df_transformed, "transactions", database_url,
+                if_exists="replace",
+            ),
+            pool.submit(
+                load_to_database, df_summary, "transaction_summary", database_url,
+                if_exists="replace",
+            ),
+        ]
+        for future in futures:
+            future.result()
+    
+    logger.info("ETL Pipeline completed successfully!")
     
     return {
         "rows_processed": len(df_transformed),
@@ -201,6 +478,139 @@ def run_etl_pipeline(
     }
 
 
+def write_parquet(df: pd.DataFrame, path: str | Path):
+    """Write a DataFrame as dictionary-encoded, zstd-compressed Parquet.
+
+    Meant for intermediate stage handoffs: dictionary encoding on the
+    label columns plus zstd gives a 5-10x smaller file than row-oriented
+    formats, and downstream readers get column pruning and predicate
+    pushdown for free.
+    """
+    dictionary_columns = [
+        column
+        for column in (*CATEGORICAL_COLUMNS, "day_of_week", "customer_segment")
+        if column in df.columns
+    ]
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=dictionary_columns,
+        data_page_size=1 << 20,
+        row_group_size=1 << 17,
+    )
+
+
+def _iter_record_batches(
+    file_path: str | Path,
+    file_format: Literal["csv", "parquet"],
+    batch_rows: int,
+):
+    """Yield Arrow record batches from a CSV or Parquet input."""
+    if file_format == "csv":
+        with pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+            convert_options=pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES),
+        ) as reader:
+            yield from reader
+    elif file_format == "parquet":
+        yield from pq.ParquetFile(file_path).iter_batches(batch_size=batch_rows)
+    else:
+        raise ValueError(f"Unsupported format for streaming: {file_format}")
+
+
+def run_etl_pipeline_streaming(
+    input_file: str | Path,
+    database_url: str,
+    file_format: Literal["csv", "parquet"] = "csv",
+    batch_rows: int = 1_000_000,
+):
+    """
+    Run the ETL pipeline one record batch at a time.
+
+    Peak memory stays near one batch instead of the full dataset, and a
+    background thread drains transformed batches into the database while
+    the next batch is parsed and transformed. The summary is combined
+    exactly from per-batch partial sums and counts. One caveat:
+    duplicate transaction_ids are only removed within a batch.
+
+    Args:
+        input_file: Path to input data file
+        database_url: Database connection URL
+        file_format: Input file format (csv, parquet)
+        batch_rows: Rows per record batch
+    """
+    logger.info("Starting ETL Pipeline (streaming)")
+
+    batches_to_load: queue.Queue = queue.Queue(maxsize=2)
+    load_errors: list[Exception] = []
+
+    def _drain():
+        first = True
+        while (frame := batches_to_load.get()) is not None:
+            if load_errors:  # keep consuming so the producer never blocks
+                continue
+            try:
+                load_to_database(
+                    frame,
+                    "transactions",
+                    database_url,
+                    if_exists="replace" if first else "append",
+                )
+                first = False
+            except Exception as exc:
+                load_errors.append(exc)
+
+    loader = threading.Thread(target=_drain)
+    loader.start()
+
+    rows_processed = 0
+    partials = []
+    try:
+        for batch in _iter_record_batches(input_file, file_format, batch_rows):
+            df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+            df = transform_data(df)
+            rows_processed += len(df)
+            partials.append(
+                df.groupby("category", observed=True, sort=False).agg(
+                    total_transactions=("transaction_id", "count"),
+                    total_revenue=("total_amount", "sum"),
+                    total_quantity=("quantity", "sum"),
+                )
+            )
+            batches_to_load.put(df)
+    finally:
+        batches_to_load.put(None)
+        loader.join()
+    if load_errors:
+        raise load_errors[0]
+
+    # Combine the partial aggregates; sums and counts compose exactly
+    df_summary = (
+        pd.concat(partials)
+        .groupby(level=0, observed=True, sort=False)
+        .sum()
+        .reset_index()
+    )
+    df_summary["avg_order_value"] = (
+        df_summary["total_revenue"] / df_summary["total_transactions"]
+    ).round(2)
+    df_summary["total_revenue"] = df_summary["total_revenue"].round(2)
+
+    load_to_database(df_summary, "transaction_summary", database_url, if_exists="replace")
+
+    logger.info("ETL Pipeline (streaming) completed successfully!")
+
+    return {
+        "rows_processed": rows_processed,
+        "categories": len(df_summary),
+        "total_revenue": float(df_summary["total_revenue"].sum()),
+    }
+
+
 if __name__ == "__main__":
     import sys
     from database_utils import get_database_url
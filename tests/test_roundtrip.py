@@ -0,0 +1,46 @@
+"""Write/extract roundtrip tests for the shared dataset helpers."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+
+from data_generators import generate_sample_data, write_dataset
+from etl_operations import extract_data
+
+
+def test_csv_roundtrip(tmp_path):
+    """A generated CSV must be readable with the explicit Arrow schema."""
+    df = generate_sample_data(1_000, seed=7)
+    path = tmp_path / "transactions.csv"
+    write_dataset(df, path, "csv")
+
+    extracted = extract_data(path, "csv")
+
+    assert len(extracted) == len(df)
+    assert list(extracted.columns) == list(df.columns)
+    # kind is "M" for numpy datetime64 and ArrowDtype timestamps alike;
+    # is_datetime64_any_dtype rejects the Arrow-backed column
+    assert extracted["transaction_date"].dtype.kind == "M"
+    pd.testing.assert_series_equal(
+        pd.Series(extracted["transaction_date"].to_numpy()),
+        pd.Series(df["transaction_date"].to_numpy()),
+    )
+
+
+def test_json_roundtrip(tmp_path):
+    """JSON output must serialize dates as ISO strings, not epoch ints."""
+    df = generate_sample_data(1_000, seed=7)
+    path = tmp_path / "transactions.json"
+    write_dataset(df, path, "json")
+
+    extracted = extract_data(path, "json")
+
+    assert len(extracted) == len(df)
+    parsed = pd.to_datetime(extracted["transaction_date"], format="ISO8601")
+    pd.testing.assert_series_equal(
+        pd.Series(parsed.to_numpy()),
+        pd.Series(df["transaction_date"].to_numpy()),
+    )